@@ -5,33 +5,128 @@ Uses only built-in Python libraries - no external dependencies required
 """
 
 import http.server
-import socketserver
 import json
-import urllib.parse
 import os
 import re
-from typing import Dict, List, Any
 import sqlite3
-from datetime import datetime
-import tempfile
-import shutil
+import threading
+
+# orjson serializes straight to bytes several times faster than the stdlib
+# encoder; fall back to json so the server still runs with no third-party
+# packages installed.
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data)
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data).encode()
+
+    def _json_loads(data):
+        return json.loads(data)
+
+# pyahocorasick walks the text once regardless of dictionary size, which wins
+# over the alternation regex as the skills list grows. Optional: the compiled
+# regex fallback covers the same job when it is not installed.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Extraction patterns, compiled once at import time instead of per upload.
+# _EXP_RE is applied to the already-lowercased text, so no IGNORECASE flag.
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Anchored to start and end on a digit, with digit lookarounds so the scan
+# cannot start mid-number; the old pattern's bare {8,15} character class
+# backtracked heavily on digit-dense text and matched runs of spaces/dashes
+_PHONE_RE = re.compile(r'(?<!\d)\+?\(?[1-9][\d\s\-\(\)]{6,16}\d(?!\d)')
+_EXP_RE = re.compile(r'(\d+)[\+]?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)')
+
+# Translate table that deletes digits; `line.translate(_DIGIT_STRIP) == line`
+# is a C-level "contains no digit" test.
+_DIGIT_STRIP = str.maketrans('', '', '0123456789')
 
 class ResumeProcessor:
+    # The dashboard aggregates only change on upload/delete/evaluate, so they
+    # are cached between writes. Class-level, shared across handler threads.
+    _stats_cache = None
+    _stats_lock = threading.Lock()
+
     def __init__(self):
-        self.skills_db = [
+        # Stored lowercase: matching runs against lowercased text, so the
+        # dictionary is normalized once here rather than per scan.
+        self.skills_db = [skill.lower() for skill in (
             'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
             'sql', 'mysql', 'postgresql', 'mongodb', 'aws', 'azure', 'docker',
             'kubernetes', 'git', 'jenkins', 'tensorflow', 'machine learning',
             'data science', 'html', 'css', 'php', 'c++', 'c#', '.net', 'spring',
             'django', 'flask', 'express', 'bootstrap', 'jquery', 'typescript'
-        ]
+        )]
+        # Compile the skill-scan pattern once so extraction is a single pass
+        # over the resume text instead of one substring search per skill.
+        # Lookarounds are used instead of \b so skills like 'c++' and '.net'
+        # still match at word edges (longest alternatives first so e.g.
+        # 'javascript' wins over 'java').
+        self._skill_re = re.compile(
+            r'(?<![a-z0-9])('
+            + '|'.join(re.escape(s) for s in sorted(self.skills_db, key=len, reverse=True))
+            + r')(?![a-z0-9])'
+        )
+        # Aho-Corasick automaton over the same dictionary, when available
+        if ahocorasick is not None:
+            self._skills_ac = ahocorasick.Automaton()
+            for skill in self.skills_db:
+                self._skills_ac.add_word(skill, skill)
+            self._skills_ac.make_automaton()
+        else:
+            self._skills_ac = None
+        # Writers (upload/delete/evaluate) serialize on this lock; with WAL,
+        # readers on other threads proceed concurrently.
+        self.write_lock = threading.Lock()
+        # One connection per server thread - sqlite3 connections are not
+        # thread-safe, and per-thread readers avoid contending on one handle.
+        self._local = threading.local()
         self.init_database()
-    
+
+    def _connect(self):
+        """Open a connection configured for this app
+
+        Applied per connection: row factory, statement cache and pragmas
+        (WAL lets dashboard reads proceed while uploads/evaluations write;
+        synchronous=NORMAL is WAL-safe; temp structures stay in memory;
+        reads are memory-mapped; negative cache_size is KiB, so 64 MiB).
+        """
+        conn = sqlite3.connect('resume_system.db', cached_statements=256)
+        # Rows come back as sqlite3.Row: named access, zero-copy views over
+        # the result tuple, and directly convertible with dict(row).
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('PRAGMA cache_size=-65536')
+        # Off by default in sqlite3; required for the ON DELETE CASCADE
+        # clauses to fire
+        cursor.execute('PRAGMA foreign_keys=ON')
+        return conn
+
+    @property
+    def conn(self):
+        """The calling thread's connection, opened lazily"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
     def init_database(self):
         """Initialize SQLite database"""
-        self.conn = sqlite3.connect('resume_system.db', check_same_thread=False)
         cursor = self.conn.cursor()
-        
+
         # Create tables
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS jobs (
@@ -57,10 +152,10 @@ class ResumeProcessor:
                 skills TEXT,
                 experience_years INTEGER DEFAULT 0,
                 summary TEXT,
-                uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                uploaded_at TIMESTAMP NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
             )
         ''')
-        
+
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS evaluations (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -75,17 +170,55 @@ class ResumeProcessor:
                 missing_skills TEXT,
                 recommendations TEXT,
                 evaluation_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (job_id) REFERENCES jobs (id),
-                FOREIGN KEY (resume_id) REFERENCES resumes (id)
+                FOREIGN KEY (job_id) REFERENCES jobs (id) ON DELETE CASCADE,
+                FOREIGN KEY (resume_id) REFERENCES resumes (id) ON DELETE CASCADE
             )
         ''')
         
+        # Normalized skill rows: the comma-separated text columns stay for
+        # display, but matching joins these tables so evaluate_batch can do
+        # its set algebra in SQL instead of splitting strings per resume.
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS resume_skills (
+                resume_id INTEGER NOT NULL REFERENCES resumes (id) ON DELETE CASCADE,
+                skill TEXT NOT NULL,
+                PRIMARY KEY (resume_id, skill)
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_skills (
+                job_id INTEGER NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+                skill TEXT NOT NULL,
+                PRIMARY KEY (job_id, skill)
+            )
+        ''')
+
+        # Indexes for the hot lookups: results by job served pre-sorted from
+        # the composite index, the evaluation cleanup by resume on delete,
+        # and the newest-first resume listing.
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_eval_job_score ON evaluations(job_id, relevance_score DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_eval_resume ON evaluations(resume_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_resumes_uploaded ON resumes(uploaded_at DESC)')
+
         self.conn.commit()
-        
+
         # Insert sample data if empty
         cursor.execute('SELECT COUNT(*) FROM jobs')
         if cursor.fetchone()[0] == 0:
             self.insert_sample_data()
+
+        # Backfill the normalized skill tables for databases created before
+        # they existed
+        cursor.execute('SELECT COUNT(*) FROM resume_skills')
+        if cursor.fetchone()[0] == 0:
+            cursor.execute('SELECT id, skills FROM resumes')
+            for row in cursor.fetchall():
+                self.index_resume_skills(cursor, row['id'], row['skills'])
+            cursor.execute('SELECT id, skills_required FROM jobs')
+            for row in cursor.fetchall():
+                self.index_job_skills(cursor, row['id'], row['skills_required'])
+            self.conn.commit()
     
     def insert_sample_data(self):
         """Insert sample jobs and resumes"""
@@ -112,6 +245,7 @@ class ResumeProcessor:
                 INSERT INTO jobs (title, company, location, description, requirements, skills_required, experience_min, experience_max)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             ''', job)
+            self.index_job_skills(cursor, cursor.lastrowid, job[5])
         
         # Sample resumes
         resumes = [
@@ -132,9 +266,71 @@ class ResumeProcessor:
                 INSERT INTO resumes (candidate_name, email, phone, skills, experience_years, summary)
                 VALUES (?, ?, ?, ?, ?, ?)
             ''', resume)
-        
+            self.index_resume_skills(cursor, cursor.lastrowid, resume[3])
+
         self.conn.commit()
-    
+
+    @staticmethod
+    def _split_skills(skills_text):
+        """Split comma-separated skills into an ordered, unique, lowered list"""
+        seen = {}
+        for s in (skills_text or '').split(','):
+            s = s.strip().lower()
+            if s and s not in seen:
+                seen[s] = None
+        return list(seen)
+
+    def index_resume_skills(self, cursor, resume_id, skills_text):
+        """Refresh the normalized skill rows for a resume"""
+        cursor.execute('DELETE FROM resume_skills WHERE resume_id = ?', (resume_id,))
+        cursor.executemany('INSERT INTO resume_skills (resume_id, skill) VALUES (?, ?)',
+                           [(resume_id, s) for s in self._split_skills(skills_text)])
+
+    def index_job_skills(self, cursor, job_id, skills_text):
+        """Refresh the normalized skill rows for a job"""
+        cursor.execute('DELETE FROM job_skills WHERE job_id = ?', (job_id,))
+        cursor.executemany('INSERT INTO job_skills (job_id, skill) VALUES (?, ?)',
+                           [(job_id, s) for s in self._split_skills(skills_text)])
+
+    def find_skills(self, text_lower):
+        """Return the set of known skills present in lowercased text
+
+        One Aho-Corasick pass when pyahocorasick is installed, otherwise one
+        pass with the precompiled alternation regex. Hits are gated on
+        non-alphanumeric boundaries either way, so e.g. 'java' does not fire
+        inside 'javascript'.
+        """
+        if self._skills_ac is not None:
+            found = set()
+            n = len(text_lower)
+            for end, skill in self._skills_ac.iter(text_lower):
+                start = end - len(skill) + 1
+                if start > 0 and text_lower[start - 1].isalnum():
+                    continue
+                if end + 1 < n and text_lower[end + 1].isalnum():
+                    continue
+                found.add(skill)
+            return found
+        return {m.group(1) for m in self._skill_re.finditer(text_lower)}
+
+    @classmethod
+    def cached_stats(cls):
+        """Return the cached dashboard statistics, or None if stale"""
+        with cls._stats_lock:
+            return cls._stats_cache
+
+    @classmethod
+    def store_stats(cls, stats):
+        """Cache freshly computed dashboard statistics"""
+        with cls._stats_lock:
+            cls._stats_cache = stats
+
+    @classmethod
+    def invalidate_stats(cls):
+        """Drop the cached statistics after a write"""
+        with cls._stats_lock:
+            cls._stats_cache = None
+
     def calculate_match_score(self, resume_skills: str, job_skills: str, resume_exp: int, job_min_exp: int, job_max_exp: int):
         """Calculate matching score between resume and job"""
         resume_skill_list = [s.strip().lower() for s in resume_skills.split(',') if s.strip()]
@@ -182,9 +378,147 @@ class ResumeProcessor:
             'recommendations': recommendations
         }
 
+    @staticmethod
+    def score_batch(entries, job_skill_list, job_min_exp, job_max_exp):
+        """Score (matched_skills, experience) entries against one job at once
+
+        The skill intersection itself happens set-wise in SQL against the
+        normalized resume_skills/job_skills tables (see evaluate_batch); this
+        turns the per-resume aggregates into scores with straight arithmetic.
+        Returns one result dict per input entry, in order, in the same shape
+        as calculate_match_score.
+        """
+        job_count = max(len(job_skill_list), 1)
+
+        results = []
+        for matched_set, resume_exp in entries:
+            matched_skills = [s for s in job_skill_list if s in matched_set]
+            missing_skills = [s for s in job_skill_list if s not in matched_set]
+            skills_score = (len(matched_skills) / job_count) * 100
+
+            if job_min_exp <= resume_exp <= job_max_exp:
+                exp_score = 100
+            elif resume_exp < job_min_exp:
+                exp_score = max(0, 100 - (job_min_exp - resume_exp) * 20)
+            else:
+                exp_score = max(70, 100 - (resume_exp - job_max_exp) * 5)
+
+            overall_score = (skills_score * 0.6) + (exp_score * 0.4)
+
+            if overall_score >= 75:
+                fit_level = "High"
+            elif overall_score >= 50:
+                fit_level = "Medium"
+            else:
+                fit_level = "Low"
+
+            recommendations = f"Score: {overall_score:.1f}%. "
+            if matched_skills:
+                recommendations += f"Strong in: {', '.join(matched_skills[:3])}. "
+            if missing_skills:
+                recommendations += f"Develop: {', '.join(missing_skills[:3])}."
+
+            results.append({
+                'relevance_score': round(overall_score, 1),
+                'skills_match_score': round(skills_score, 1),
+                'experience_match_score': round(exp_score, 1),
+                'overall_fit': fit_level,
+                'matched_skills': ','.join(matched_skills),
+                'missing_skills': ','.join(missing_skills),
+                'recommendations': recommendations
+            })
+        return results
+
+_processor = None
+_processor_lock = threading.Lock()
+
+# Worker-process pool for scoring large evaluation batches. Created on first
+# use; below _SCORE_POOL_MIN resumes the dispatch overhead outweighs the win
+# and scoring stays on the request thread.
+_score_pool = None
+_score_pool_lock = threading.Lock()
+_SCORE_POOL_MIN = 64
+
+def _get_score_pool():
+    """Return the shared scoring pool, creating it on first use"""
+    global _score_pool
+    with _score_pool_lock:
+        if _score_pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            _score_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _score_pool
+
+def _score_chunk(args):
+    """Worker for evaluate_batch: score one chunk of entries on another core"""
+    entries, job_skill_list, job_min_exp, job_max_exp = args
+    return ResumeProcessor.score_batch(entries, job_skill_list, job_min_exp, job_max_exp)
+
+def get_processor():
+    """Return the shared ResumeProcessor, creating it on first use
+
+    Constructing a processor per request re-opened the SQLite database for
+    every connection; one shared instance amortizes that setup and lets the
+    request path start on the actual query immediately.
+    """
+    global _processor
+    with _processor_lock:
+        if _processor is None:
+            _processor = ResumeProcessor()
+        return _processor
+
 class RequestHandler(http.server.SimpleHTTPRequestHandler):
+    # HTTP/1.1 so connections persist between requests; responses carry
+    # Content-Length (or declare Connection: close when streaming), sparing
+    # the dashboard a TCP handshake per poll.
+    protocol_version = 'HTTP/1.1'
+
+    # Hot statements as class-level constants: the SQL text is interned once,
+    # giving the connection's prepared-statement cache stable keys.
+    _SQL_GET_JOBS = """
+        SELECT id, title, company, location, description, requirements,
+               skills_required, experience_min, experience_max
+        FROM jobs ORDER BY created_at DESC
+    """
+    _SQL_GET_RESUMES = """
+        SELECT id, candidate_name, email, phone, skills, experience_years, summary
+        FROM resumes ORDER BY uploaded_at DESC
+    """
+    _SQL_GET_RESULTS = """
+        SELECT id, job_id, resume_id, candidate_name, relevance_score,
+               skills_match_score, experience_match_score, overall_fit,
+               matched_skills, missing_skills, recommendations
+        FROM evaluations WHERE job_id = ? ORDER BY relevance_score DESC
+    """
+    _SQL_GET_STATS = """
+        SELECT (SELECT COUNT(*) FROM jobs),
+               (SELECT COUNT(*) FROM resumes),
+               (SELECT COUNT(*) FROM evaluations),
+               (SELECT COALESCE(AVG(relevance_score), 0) FROM evaluations)
+    """
+    _SQL_RESUME_DETAILS = """
+        SELECT id, candidate_name, email, phone, skills, experience_years,
+               summary, uploaded_at
+        FROM resumes WHERE id = ?
+    """
+    _SQL_INSERT_RESUME = """
+        INSERT INTO resumes (candidate_name, email, phone, skills, experience_years, summary)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    _SQL_MATCHED_SKILLS = """
+        SELECT rs.resume_id, rs.skill
+        FROM resume_skills rs
+        JOIN job_skills js ON js.skill = rs.skill
+        WHERE js.job_id = ?
+    """
+    _SQL_INSERT_EVAL = """
+        INSERT INTO evaluations
+        (job_id, resume_id, candidate_name, relevance_score, skills_match_score,
+         experience_match_score, overall_fit, matched_skills, missing_skills, recommendations)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, *args, **kwargs):
-        self.processor = ResumeProcessor()
+        self.processor = get_processor()
         super().__init__(*args, **kwargs)
     
     def do_GET(self):
@@ -203,6 +537,8 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
             self.get_results(job_id)
         elif self.path == '/api/stats':
             self.get_stats()
+        elif self.path == '/api/bootstrap':
+            self.get_bootstrap()
         else:
             self.send_error(404)
     
@@ -223,9 +559,9 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
         else:
             self.send_error(404)
     
-    def serve_dashboard(self):
-        """Serve the main dashboard HTML"""
-        html = '''
+    # The dashboard page is static, so it is encoded once at import time and
+    # served from a file descriptor via os.sendfile (see serve_dashboard).
+    DASHBOARD_HTML = '''
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -387,43 +723,52 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
             if (tabName === 'evaluate') loadEvaluateTab();
         }
         
-        // Load dashboard data
+        // Load dashboard data (single coalesced request, fanned out locally)
         async function loadDashboard() {
             try {
-                const stats = await fetch('/api/stats').then(r => r.json());
+                const data = await fetch('/api/bootstrap').then(r => r.json());
+                const stats = data.stats;
                 document.getElementById('totalJobs').textContent = stats.total_jobs;
                 document.getElementById('totalResumes').textContent = stats.total_resumes;
                 document.getElementById('totalEvaluations').textContent = stats.total_evaluations;
                 document.getElementById('avgScore').textContent = stats.avg_score + '%';
-                
-                const evaluations = await fetch('/api/results/1').then(r => r.json());
-                const html = evaluations.slice(0, 5).map(e => 
+
+                const html = data.recent.map(e =>
                     `<div style="padding: 0.5rem; border-left: 3px solid ${getFitColor(e.overall_fit)};">
                         <strong>${e.candidate_name}</strong> - ${e.relevance_score}% (${e.overall_fit} Fit)
                     </div>`
                 ).join('');
                 document.getElementById('recentEvaluations').innerHTML = html || 'No evaluations yet';
+
+                // Pre-render the other tabs from the same payload
+                renderJobs(data.jobs);
+                renderResumes(data.resumes);
             } catch (e) {
                 console.error('Error loading dashboard:', e);
             }
         }
-        
+
+        // Render jobs table
+        function renderJobs(jobs) {
+            const html = `<table>
+                <thead><tr><th>Title</th><th>Location</th><th>Required Skills</th><th>Experience</th></tr></thead>
+                <tbody>${jobs.map(j =>
+                    `<tr>
+                        <td><strong>${j.title}</strong><br><small>${j.company}</small></td>
+                        <td>${j.location}</td>
+                        <td>${j.skills_required}</td>
+                        <td>${j.experience_min}-${j.experience_max} years</td>
+                    </tr>`
+                ).join('')}</tbody>
+            </table>`;
+            document.getElementById('jobsList').innerHTML = html;
+        }
+
         // Load jobs
         async function loadJobs() {
             try {
                 const jobs = await fetch('/api/jobs').then(r => r.json());
-                const html = `<table>
-                    <thead><tr><th>Title</th><th>Location</th><th>Required Skills</th><th>Experience</th></tr></thead>
-                    <tbody>${jobs.map(j => 
-                        `<tr>
-                            <td><strong>${j.title}</strong><br><small>${j.company}</small></td>
-                            <td>${j.location}</td>
-                            <td>${j.skills_required}</td>
-                            <td>${j.experience_min}-${j.experience_max} years</td>
-                        </tr>`
-                    ).join('')}</tbody>
-                </table>`;
-                document.getElementById('jobsList').innerHTML = html;
+                renderJobs(jobs);
             } catch (e) {
                 document.getElementById('jobsList').innerHTML = 'Error loading jobs';
             }
@@ -541,30 +886,35 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
             }
         }
         
+        // Render resumes table
+        function renderResumes(resumes) {
+            const html = `<table>
+                <thead><tr><th>Candidate</th><th>Skills</th><th>Experience</th><th>Contact</th><th>Actions</th></tr></thead>
+                <tbody>${resumes.map(r =>
+                    `<tr>
+                        <td><strong>${r.candidate_name}</strong></td>
+                        <td>${r.skills}</td>
+                        <td>${r.experience_years} years</td>
+                        <td>${r.email}<br>${r.phone}</td>
+                        <td>
+                            <button class="btn btn-small" onclick="viewResume(${r.id})" style="margin-right: 0.5rem;">
+                                👁️ View
+                            </button>
+                            <button class="btn btn-danger btn-small" onclick="deleteResume(${r.id}, '${r.candidate_name}')">
+                                🗑️ Delete
+                            </button>
+                        </td>
+                    </tr>`
+                ).join('')}</tbody>
+            </table>`;
+            document.getElementById('resumesList').innerHTML = html;
+        }
+
         // Load resumes
         async function loadResumes() {
             try {
                 const resumes = await fetch('/api/resumes').then(r => r.json());
-                const html = `<table>
-                    <thead><tr><th>Candidate</th><th>Skills</th><th>Experience</th><th>Contact</th><th>Actions</th></tr></thead>
-                    <tbody>${resumes.map(r => 
-                        `<tr>
-                            <td><strong>${r.candidate_name}</strong></td>
-                            <td>${r.skills}</td>
-                            <td>${r.experience_years} years</td>
-                            <td>${r.email}<br>${r.phone}</td>
-                            <td>
-                                <button class="btn btn-small" onclick="viewResume(${r.id})" style="margin-right: 0.5rem;">
-                                    👁️ View
-                                </button>
-                                <button class="btn btn-danger btn-small" onclick="deleteResume(${r.id}, '${r.candidate_name}')">
-                                    🗑️ Delete
-                                </button>
-                            </td>
-                        </tr>`
-                    ).join('')}</tbody>
-                </table>`;
-                document.getElementById('resumesList').innerHTML = html;
+                renderResumes(resumes);
             } catch (e) {
                 document.getElementById('resumesList').innerHTML = 'Error loading resumes';
             }
@@ -653,129 +1003,169 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
     </script>
 </body>
 </html>
-        '''
-        
+        '''.encode('utf-8')
+
+    _dashboard_file = None
+    _dashboard_lock = threading.Lock()
+
+    @classmethod
+    def _dashboard_fd(cls):
+        """Return a file descriptor holding the dashboard bytes
+
+        Backed by an unlinked temporary file created on first use, so
+        serve_dashboard can hand the payload to os.sendfile.
+        """
+        with cls._dashboard_lock:
+            if cls._dashboard_file is None:
+                import tempfile
+                tmp = tempfile.TemporaryFile()
+                tmp.write(cls.DASHBOARD_HTML)
+                tmp.flush()
+                cls._dashboard_file = tmp
+            return cls._dashboard_file.fileno()
+
+    def serve_dashboard(self):
+        """Serve the main dashboard HTML"""
         self.send_response(200)
         self.send_header('Content-type', 'text/html')
+        self.send_header('Content-Length', str(len(self.DASHBOARD_HTML)))
         self.end_headers()
-        self.wfile.write(html.encode())
+
+        if hasattr(os, 'sendfile'):
+            # Zero-copy path: the kernel moves the bytes straight from the
+            # page cache to the socket, skipping the userspace copy.
+            offset = 0
+            try:
+                self.wfile.flush()
+                fd = self._dashboard_fd()
+                remaining = len(self.DASHBOARD_HTML)
+                while remaining:
+                    sent = os.sendfile(self.connection.fileno(), fd, offset, remaining)
+                    if not sent:
+                        break
+                    offset += sent
+                    remaining -= sent
+                return
+            except OSError:
+                if offset:
+                    raise
+        self.wfile.write(self.DASHBOARD_HTML)
     
+    def _fetch_jobs(self):
+        """Fetch all jobs as a list of dicts"""
+        cursor = self.processor.conn.cursor()
+        cursor.execute(self._SQL_GET_JOBS)
+        return [dict(row) for row in cursor.fetchall()]
+
     def get_jobs(self):
         """Get all jobs"""
         cursor = self.processor.conn.cursor()
-        cursor.execute('SELECT * FROM jobs ORDER BY created_at DESC')
-        jobs = []
-        for row in cursor.fetchall():
-            jobs.append({
-                'id': row[0], 'title': row[1], 'company': row[2], 'location': row[3],
-                'description': row[4], 'requirements': row[5], 'skills_required': row[6],
-                'experience_min': row[7], 'experience_max': row[8]
-            })
-        
-        self.send_json_response(jobs)
-    
+        cursor.execute(self._SQL_GET_JOBS)
+        self.send_json_stream(cursor)
+
+    def _fetch_resumes(self):
+        """Fetch all resumes as a list of dicts"""
+        cursor = self.processor.conn.cursor()
+        cursor.execute(self._SQL_GET_RESUMES)
+        return [dict(row) for row in cursor.fetchall()]
+
     def get_resumes(self):
         """Get all resumes"""
         cursor = self.processor.conn.cursor()
-        cursor.execute('SELECT * FROM resumes ORDER BY uploaded_at DESC')
-        resumes = []
-        for row in cursor.fetchall():
-            resumes.append({
-                'id': row[0], 'candidate_name': row[1], 'email': row[2], 'phone': row[3],
-                'skills': row[4], 'experience_years': row[5], 'summary': row[6]
-            })
-        
-        self.send_json_response(resumes)
+        cursor.execute(self._SQL_GET_RESUMES)
+        self.send_json_stream(cursor)
     
     def get_resume_details(self, resume_id):
         """Get detailed information for a specific resume"""
         try:
             cursor = self.processor.conn.cursor()
-            cursor.execute('SELECT * FROM resumes WHERE id = ?', (resume_id,))
+            cursor.execute(self._SQL_RESUME_DETAILS, (resume_id,))
             row = cursor.fetchone()
             
             if not row:
                 self.send_json_response({'success': False, 'error': 'Resume not found'})
                 return
             
-            resume_details = {
-                'id': row[0],
-                'candidate_name': row[1],
-                'email': row[2],
-                'phone': row[3],
-                'skills': row[4],
-                'experience_years': row[5],
-                'summary': row[6],
-                'uploaded_at': row[7]
-            }
-            
-            self.send_json_response(resume_details)
+            self.send_json_response(dict(row))
             
         except Exception as e:
             self.send_json_response({'success': False, 'error': str(e)})
     
+    def _fetch_results(self, job_id):
+        """Fetch evaluation results for a job as a list of dicts"""
+        cursor = self.processor.conn.cursor()
+        cursor.execute(self._SQL_GET_RESULTS, (job_id,))
+        return [dict(row) for row in cursor.fetchall()]
+
     def get_results(self, job_id):
         """Get evaluation results for a job"""
         cursor = self.processor.conn.cursor()
-        cursor.execute('SELECT * FROM evaluations WHERE job_id = ? ORDER BY relevance_score DESC', (job_id,))
-        results = []
-        for row in cursor.fetchall():
-            results.append({
-                'id': row[0], 'job_id': row[1], 'resume_id': row[2], 'candidate_name': row[3],
-                'relevance_score': row[4], 'skills_match_score': row[5], 'experience_match_score': row[6],
-                'overall_fit': row[7], 'matched_skills': row[8], 'missing_skills': row[9],
-                'recommendations': row[10]
-            })
-        
-        self.send_json_response(results)
-    
-    def get_stats(self):
-        """Get dashboard statistics"""
+        cursor.execute(self._SQL_GET_RESULTS, (job_id,))
+        self.send_json_stream(cursor)
+
+    def _fetch_stats(self):
+        """Fetch dashboard statistics as a dict (cached between writes)"""
+        stats = ResumeProcessor.cached_stats()
+        if stats is not None:
+            return stats
+
+        # All four aggregates in one statement - one SQLite VM entry instead
+        # of three separate round trips
         cursor = self.processor.conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM jobs')
-        total_jobs = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM resumes')
-        total_resumes = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*), AVG(relevance_score) FROM evaluations')
-        eval_stats = cursor.fetchone()
-        total_evaluations = eval_stats[0] or 0
-        avg_score = round(eval_stats[1] or 0, 1)
-        
+        cursor.execute(self._SQL_GET_STATS)
+        total_jobs, total_resumes, total_evaluations, avg_score = cursor.fetchone()
+
         stats = {
             'total_jobs': total_jobs,
             'total_resumes': total_resumes,
             'total_evaluations': total_evaluations,
-            'avg_score': avg_score
+            'avg_score': round(avg_score, 1)
         }
-        
-        self.send_json_response(stats)
+        ResumeProcessor.store_stats(stats)
+        return stats
+
+    def get_stats(self):
+        """Get dashboard statistics"""
+        self.send_json_response(self._fetch_stats())
+
+    def get_bootstrap(self):
+        """Get stats, jobs, resumes and recent evaluations in one payload
+
+        The dashboard used to fire four separate AJAX calls; coalescing them
+        into one response saves three round trips and lets all four SELECTs
+        share a single transaction snapshot on the SQLite connection.
+        """
+        with self.processor.conn:
+            payload = {
+                'stats': self._fetch_stats(),
+                'jobs': self._fetch_jobs(),
+                'resumes': self._fetch_resumes(),
+                'recent': self._fetch_results(1)[:5]
+            }
+        self.send_json_response(payload)
     
     def delete_resume(self, resume_id):
         """Delete a resume and its associated evaluations"""
         try:
-            cursor = self.processor.conn.cursor()
-            
-            # First, get the candidate name for confirmation
-            cursor.execute('SELECT candidate_name FROM resumes WHERE id = ?', (resume_id,))
-            result = cursor.fetchone()
-            
+            # One statement: the RETURNING clause doubles as the existence
+            # check and the ON DELETE CASCADE constraints on evaluations and
+            # resume_skills remove the dependent rows inside the same write
+            with self.processor.write_lock:
+                cursor = self.processor.conn.cursor()
+                cursor.execute(
+                    'DELETE FROM resumes WHERE id = ? RETURNING candidate_name',
+                    (resume_id,)
+                )
+                result = cursor.fetchone()
+                self.processor.conn.commit()
+
             if not result:
                 self.send_json_response({'success': False, 'error': 'Resume not found'})
                 return
-            
+
             candidate_name = result[0]
-            
-            # Delete associated evaluations first (foreign key constraint)
-            cursor.execute('DELETE FROM evaluations WHERE resume_id = ?', (resume_id,))
-            
-            # Delete the resume
-            cursor.execute('DELETE FROM resumes WHERE id = ?', (resume_id,))
-            
-            self.processor.conn.commit()
-            
+            ResumeProcessor.invalidate_stats()
+
             self.send_json_response({
                 'success': True,
                 'message': f'Resume for {candidate_name} deleted successfully'
@@ -801,118 +1191,99 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
             
             # Read the uploaded data
             post_data = self.rfile.read(content_length)
-            
-            # Parse the multipart data
-            boundary = content_type.split('boundary=')[1].encode()
-            parts = post_data.split(b'--' + boundary)
-            
+
+            # Parse the multipart body with the stdlib MIME parser instead of
+            # splitting the payload on the boundary, which copied every part
+            # and hand-rolled the header/CRLF handling. The feed parser takes
+            # the synthetic header and the body as separate chunks, so the
+            # payload is never concatenated into a second buffer.
+            from email import policy
+            from email.feedparser import BytesFeedParser
+            parser = BytesFeedParser(policy=policy.default)
+            parser.feed(b'Content-Type: ' + content_type.encode() + b'\r\n\r\n')
+            parser.feed(post_data)
+            msg = parser.close()
+
             file_data = None
             filename = None
-            
-            for part in parts:
-                if b'Content-Disposition: form-data' in part and b'filename=' in part:
-                    # Extract filename
-                    lines = part.split(b'\r\n')
-                    for line in lines:
-                        if b'filename=' in line:
-                            filename = line.decode().split('filename="')[1].split('"')[0]
-                            break
-                    
-                    # Extract file content (after double CRLF)
-                    content_start = part.find(b'\r\n\r\n')
-                    if content_start != -1:
-                        file_data = part[content_start + 4:]
-                        # Remove trailing CRLF
-                        if file_data.endswith(b'\r\n'):
-                            file_data = file_data[:-2]
+
+            for part in msg.iter_parts():
+                filename = part.get_filename()
+                if filename:
+                    file_data = part.get_payload(decode=True)
                     break
-            
+
             if not file_data or not filename:
                 self.send_json_response({'success': False, 'error': 'No file found in upload'})
                 return
-            
-            # Save file temporarily and process
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as temp_file:
-                temp_file.write(file_data)
-                temp_path = temp_file.name
-            
-            try:
-                # Process the resume (simplified text extraction)
-                file_ext = os.path.splitext(filename)[1].lower()
-                if file_ext == '.txt':
-                    with open(temp_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        text = f.read()
-                else:
-                    # For other formats, treat as text for now
-                    with open(temp_path, 'rb') as f:
-                        text = f.read().decode('utf-8', errors='ignore')
-                
-                # Extract basic information using regex
-                resume_data = self.extract_resume_info(text, filename)
-                
-                # Save to database
+
+            # Extract the text straight from the decoded part; spooling it
+            # through a temp file only to read it back copied the payload
+            # twice more through the page cache
+            text = file_data.decode('utf-8', errors='ignore')
+
+            # Extract basic information using regex
+            resume_data = self.extract_resume_info(text, filename)
+
+            # Save to database
+            with self.processor.write_lock:
                 cursor = self.processor.conn.cursor()
-                cursor.execute('''
-                    INSERT INTO resumes (candidate_name, email, phone, skills, experience_years, summary, uploaded_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(self._SQL_INSERT_RESUME, (
                     resume_data['candidate_name'],
                     resume_data['email'],
                     resume_data['phone'],
                     resume_data['skills'],
                     resume_data['experience_years'],
-                    resume_data['summary'],
-                    datetime.now().isoformat()
+                    resume_data['summary']
                 ))
+                self.processor.index_resume_skills(cursor, cursor.lastrowid,
+                                                   resume_data['skills'])
                 self.processor.conn.commit()
-                
-                self.send_json_response({
-                    'success': True,
-                    'candidate_name': resume_data['candidate_name'],
-                    'message': 'Resume uploaded and processed successfully'
-                })
-                
-            finally:
-                # Clean up temp file
-                os.unlink(temp_path)
-                
+            ResumeProcessor.invalidate_stats()
+
+            self.send_json_response({
+                'success': True,
+                'candidate_name': resume_data['candidate_name'],
+                'message': 'Resume uploaded and processed successfully'
+            })
+
+
         except Exception as e:
             self.send_json_response({'success': False, 'error': str(e)})
     
     def extract_resume_info(self, text, filename):
         """Extract basic information from resume text"""
+        # Lowercase once; the skill scan and experience regex share this copy
+        text_lower = text.lower()
+
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
+        email_match = _EMAIL_RE.search(text)
         email = email_match.group() if email_match else ''
-        
+
         # Extract phone
-        phone_pattern = r'[\+]?[1-9]?[\d\s\-\(\)]{8,15}'
-        phone_match = re.search(phone_pattern, text)
+        phone_match = _PHONE_RE.search(text)
         phone = phone_match.group().strip() if phone_match else ''
         
-        # Extract name (first line or near email)
-        lines = text.split('\n')
+        # Extract name (first line or near email). Only the head of the
+        # document matters, so split just the first 512 characters rather
+        # than allocating a line list for the whole resume.
         candidate_name = ''
-        for line in lines[:5]:  # Check first 5 lines
+        for line in text[:512].splitlines()[:5]:
             line = line.strip()
-            if line and len(line.split()) <= 4 and not '@' in line and not any(char.isdigit() for char in line):
+            if (line and len(line.split()) <= 4 and '@' not in line
+                    and line.translate(_DIGIT_STRIP) == line):
                 candidate_name = line
                 break
         
         if not candidate_name:
             candidate_name = os.path.splitext(filename)[0].replace('_', ' ').replace('-', ' ').title()
         
-        # Extract skills
-        skills_found = []
-        text_lower = text.lower()
-        for skill in self.processor.skills_db:
-            if skill.lower() in text_lower:
-                skills_found.append(skill)
-        
+        # Extract skills (single pass over the text)
+        found = self.processor.find_skills(text_lower)
+        skills_found = [s for s in self.processor.skills_db if s in found]
+
         # Extract experience years
-        exp_pattern = r'(\d+)[\+]?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)'
-        exp_match = re.search(exp_pattern, text.lower())
+        exp_match = _EXP_RE.search(text_lower)
         experience_years = int(exp_match.group(1)) if exp_match else 0
         
         # Create summary
@@ -931,13 +1302,13 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
         """Run batch evaluation"""
         content_length = int(self.headers['Content-Length'])
         post_data = self.rfile.read(content_length)
-        data = json.loads(post_data.decode())
+        data = _json_loads(post_data)
         
         job_id = data.get('job_id')
         
         # Get job details
         cursor = self.processor.conn.cursor()
-        cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
+        cursor.execute('SELECT skills_required, experience_min, experience_max FROM jobs WHERE id = ?', (job_id,))
         job = cursor.fetchone()
         
         if not job:
@@ -945,51 +1316,100 @@ class RequestHandler(http.server.SimpleHTTPRequestHandler):
             return
         
         # Get all resumes
-        cursor.execute('SELECT * FROM resumes')
+        cursor.execute('SELECT id, candidate_name, experience_years FROM resumes')
         resumes = cursor.fetchall()
-        
-        # Clear previous evaluations for this job
-        cursor.execute('DELETE FROM evaluations WHERE job_id = ?', (job_id,))
-        
-        # Evaluate each resume
-        for resume in resumes:
-            result = self.processor.calculate_match_score(
-                resume[4],  # skills
-                job[6],     # job skills_required
-                resume[5],  # experience_years
-                job[7],     # experience_min
-                job[8]      # experience_max
+
+        # One set-algebra join against the normalized skill tables replaces
+        # splitting and intersecting the comma-strings per resume
+        cursor.execute(self._SQL_MATCHED_SKILLS, (job_id,))
+        matched_by_resume = {}
+        for pair in cursor.fetchall():
+            matched_by_resume.setdefault(pair['resume_id'], set()).add(pair['skill'])
+
+        # Score the whole batch, fanning large pools across worker processes
+        job_skill_list = self.processor._split_skills(job['skills_required'])
+        entries = [(matched_by_resume.get(resume['id'], ()), resume['experience_years'])
+                   for resume in resumes]
+        workers = os.cpu_count() or 1
+        if len(entries) >= _SCORE_POOL_MIN and workers > 1:
+            chunk_size = -(-len(entries) // workers)
+            chunks = [(entries[i:i + chunk_size], job_skill_list,
+                       job['experience_min'], job['experience_max'])
+                      for i in range(0, len(entries), chunk_size)]
+            results = []
+            for part in _get_score_pool().map(_score_chunk, chunks):
+                results.extend(part)
+        else:
+            results = self.processor.score_batch(
+                entries, job_skill_list, job['experience_min'], job['experience_max']
             )
-            
-            cursor.execute('''
-                INSERT INTO evaluations 
-                (job_id, resume_id, candidate_name, relevance_score, skills_match_score, 
-                 experience_match_score, overall_fit, matched_skills, missing_skills, recommendations)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_id, resume[0], resume[1], result['relevance_score'],
-                result['skills_match_score'], result['experience_match_score'],
-                result['overall_fit'], result['matched_skills'], result['missing_skills'],
-                result['recommendations']
-            ))
-        
-        self.processor.conn.commit()
-        
+
+        rows = [
+            (job_id, resume['id'], resume['candidate_name'], result['relevance_score'],
+             result['skills_match_score'], result['experience_match_score'],
+             result['overall_fit'], result['matched_skills'], result['missing_skills'],
+             result['recommendations'])
+            for resume, result in zip(resumes, results)
+        ]
+
+        # Replace this job's results as one transaction: a single executemany
+        # instead of one INSERT (and implicit commit) per resume.
+        with self.processor.write_lock, self.processor.conn:
+            self.processor.conn.execute('DELETE FROM evaluations WHERE job_id = ?', (job_id,))
+            self.processor.conn.executemany(self._SQL_INSERT_EVAL, rows)
+        ResumeProcessor.invalidate_stats()
+
         self.send_json_response({'status': 'success', 'message': f'Evaluated {len(resumes)} resumes'})
     
+    def send_json_stream(self, cursor):
+        """Stream a JSON array of rows without materializing the result set
+
+        Rows are pulled in fetchmany batches and written out incrementally,
+        so peak memory stays O(arraysize) however large the table grows and
+        the client sees the first bytes before the last row is fetched.
+        """
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        # No Content-Length for a streamed body: end-of-response is signalled
+        # by closing the connection
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        cursor.arraysize = 256
+        self.wfile.write(b'[')
+        first = True
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            # One write per batch rather than two per row
+            chunk = b','.join(_json_dumps(dict(row)) for row in rows)
+            if first:
+                first = False
+            else:
+                self.wfile.write(b',')
+            self.wfile.write(chunk)
+        self.wfile.write(b']')
+
     def send_json_response(self, data):
         """Send JSON response"""
+        body = _json_dumps(data)
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
 
 def start_server(port=8000):
     """Start the HTTP server"""
     handler = RequestHandler
-    
-    with socketserver.TCPServer(("", port), handler) as httpd:
+
+    # ThreadingHTTPServer handles each request on its own daemon thread, so
+    # a long batch evaluation no longer blocks dashboard requests.
+    with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
         print(f"🚀 Resume Relevance Check System")
         print(f"📊 Dashboard: http://localhost:{port}")
         print(f"🔧 Server running on port {port}")
@@ -7,12 +7,148 @@ Deployed on Streamlit Cloud
 import streamlit as st
 import sqlite3
 import pandas as pd
+import numpy as np
 import re
 import os
+import hashlib
+import concurrent.futures
+import threading
 from datetime import datetime
 from typing import Dict, List, Any
 import tempfile
 
+# Optional: pyahocorasick gives a single-pass scan over the skill
+# dictionary; without it extraction falls back to one compiled regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional format parsers; without them binary uploads fall back to a
+# best-effort byte decode
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+try:
+    import docx
+except ImportError:
+    docx = None
+
+# Compiled once at import; extract_resume_info runs per upload and the
+# inline patterns paid re's cache lookup and parse on every call. The
+# email class also fixes the old [A-Z|a-z] typo, which let '|' into TLDs.
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE_RE = re.compile(r'[\+]?[1-9]?[\d\s\-\(\)]{8,15}')
+# No IGNORECASE: EXP_RE runs against the lowercased copy the skill scan
+# already needs, which is cheaper than case-folding inside the engine
+EXP_RE = re.compile(r'(\d+)[\+]?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)')
+# A plausible header name line: no digits or '@', sane length. Scanned in
+# multiline mode over the top of the document.
+NAME_LINE_RE = re.compile(r'^[^\n@0-9]{2,60}$', re.M)
+
+SKILLS_DB = [
+    'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'aws', 'azure', 'docker',
+    'kubernetes', 'git', 'jenkins', 'tensorflow', 'machine learning',
+    'data science', 'html', 'css', 'php', 'c++', 'c#', '.net', 'spring',
+    'django', 'flask', 'express', 'bootstrap', 'jquery', 'typescript'
+]
+
+# Skill matchers live at module level (not on the processor) so extraction
+# is importable and picklable for worker processes; each process builds
+# them once at import. The regex alternation lists longer skills first so
+# 'javascript' beats 'java', and uses lookarounds rather than \b so
+# 'c++'/'.net' still match at word edges.
+_SKILL_RE = re.compile(
+    r'(?<![a-z0-9])('
+    + '|'.join(re.escape(s) for s in sorted(SKILLS_DB, key=len, reverse=True))
+    + r')(?![a-z0-9])'
+)
+if ahocorasick is not None:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _skill in SKILLS_DB:
+        _SKILL_AUTOMATON.add_word(_skill, _skill)
+    _SKILL_AUTOMATON.make_automaton()
+else:
+    _SKILL_AUTOMATON = None
+
+def find_skills(text_lower):
+    """Return the set of known skills present in lowercased text
+
+    One linear walk of the Aho-Corasick automaton when available (hits
+    are gated on non-alphanumeric neighbours so e.g. 'java' inside
+    'javadoc' does not count), otherwise one pass of the compiled
+    alternation.
+    """
+    if _SKILL_AUTOMATON is not None:
+        found = set()
+        for end, skill in _SKILL_AUTOMATON.iter(text_lower):
+            start = end - len(skill) + 1
+            if start > 0 and text_lower[start - 1].isalnum():
+                continue
+            if end + 1 < len(text_lower) and text_lower[end + 1].isalnum():
+                continue
+            found.add(skill)
+        return found
+    return set(m.group(1) for m in _SKILL_RE.finditer(text_lower))
+
+def extract_resume_info(text, filename):
+    """Extract basic information from resume text
+
+    A module-level function (no processor state) so worker processes can
+    run it on parsed upload text in parallel.
+    """
+    # One lowercased copy, shared by the skill scan and the experience
+    # regex; email/phone patterns handle case via their classes
+    text_lower = text.lower()
+
+    # Extract email
+    email_match = EMAIL_RE.search(text)
+    email = email_match.group() if email_match else ''
+
+    # Extract phone
+    phone_match = PHONE_RE.search(text)
+    phone = phone_match.group().strip() if phone_match else ''
+
+    # Extract name: one multiline regex pass over the document head
+    # instead of splitting the whole text into a line list and scanning
+    # each line character by character
+    candidate_name = ''
+    for match in NAME_LINE_RE.finditer(text[:500]):
+        line = match.group().strip()
+        if line and len(line.split()) <= 4:
+            candidate_name = line
+            break
+
+    if not candidate_name:
+        candidate_name = os.path.splitext(filename)[0].replace('_', ' ').replace('-', ' ').title()
+
+    # Extract skills in one scan instead of one substring search per
+    # dictionary entry (order follows the dictionary for stable output)
+    found = find_skills(text_lower)
+    skills_found = [s for s in SKILLS_DB if s in found]
+
+    # Extract experience years
+    exp_match = EXP_RE.search(text_lower)
+    experience_years = int(exp_match.group(1)) if exp_match else 0
+
+    # Create summary
+    summary = ' '.join(text.split()[:50])  # First 50 words
+
+    return {
+        'candidate_name': candidate_name or 'Unknown Candidate',
+        'email': email,
+        'phone': phone,
+        'skills': ', '.join(skills_found[:10]),  # Limit to 10 skills
+        'experience_years': experience_years,
+        'summary': summary
+    }
+
+def _extract_resume_args(args):
+    """map() adapter: unpack (text, filename) for pool workers"""
+    return extract_resume_info(*args)
+
 # Page configuration
 st.set_page_config(
     page_title="🎯 Resume Relevance Check System",
@@ -22,21 +158,73 @@ st.set_page_config(
 )
 
 class ResumeProcessor:
+    # Spelling variants mapped to the canonical dictionary entry, so
+    # 'NodeJS' on a resume still matches 'Node.js' on a job posting
+    SKILL_ALIASES = {
+        'nodejs': 'node.js',
+        'node': 'node.js',
+        'node js': 'node.js',
+        'dotnet': '.net',
+        'js': 'javascript',
+        'reactjs': 'react',
+        'postgres': 'postgresql',
+        'k8s': 'kubernetes',
+        'ml': 'machine learning',
+    }
+
     def __init__(self):
-        self.skills_db = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
-            'sql', 'mysql', 'postgresql', 'mongodb', 'aws', 'azure', 'docker',
-            'kubernetes', 'git', 'jenkins', 'tensorflow', 'machine learning',
-            'data science', 'html', 'css', 'php', 'c++', 'c#', '.net', 'spring',
-            'django', 'flask', 'express', 'bootstrap', 'jquery', 'typescript'
-        ]
+        self.skills_db = SKILLS_DB
+        # name -> skills.id and its inverse, filled lazily as skills are
+        # indexed; skills.id doubles as the skill's bit position in masks
+        self._skill_ids = {}
+        self._skill_names = {}
+        # Read-only connections are opened lazily per server thread (see
+        # the reader property); writes stay on the single shared conn
+        self._local = threading.local()
         self.init_database()
-    
+
+    @property
+    def reader(self):
+        """The calling thread's read-only connection, opened lazily
+
+        Streamlit serves sessions from a thread pool, and every session
+        shared the one check_same_thread=False connection for reads and
+        writes alike. With WAL, per-thread mode=ro connections read
+        concurrently with (and never block) the writer.
+        """
+        conn = getattr(self._local, 'reader', None)
+        if conn is None:
+            conn = sqlite3.connect('file:resume_system.db?mode=ro', uri=True,
+                                   cached_statements=128)
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute('PRAGMA mmap_size=268435456')
+            cursor.execute('PRAGMA cache_size=-65536')
+            self._local.reader = conn
+        return conn
+
+
     def init_database(self):
         """Initialize SQLite database"""
-        self.conn = sqlite3.connect('resume_system.db', check_same_thread=False)
+        # cached_statements raised from the default 100 so the app's full
+        # working set of queries stays compiled across reruns
+        self.conn = sqlite3.connect('resume_system.db', check_same_thread=False,
+                                    cached_statements=128)
+        # Named column access (row['skills']) instead of brittle positional
+        # indexing; Row is a thin C-level view, not a dict per row
+        self.conn.row_factory = sqlite3.Row
         cursor = self.conn.cursor()
-        
+
+        # WAL keeps page reads from blocking while an upload or evaluation
+        # is writing; synchronous=NORMAL is safe under WAL; mmap and the
+        # 64 MiB page cache (negative value = KiB) keep hot pages in memory
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('PRAGMA cache_size=-65536')
+
         # Create tables
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS jobs (
@@ -85,8 +273,237 @@ class ResumeProcessor:
             )
         ''')
         
+        # Indexes matching how the pages read: evaluations by job already
+        # ordered by score, recent evaluations by time, and the listing
+        # pages' ORDER BY ... DESC — without these every render was a full
+        # scan plus a temp B-tree sort
+        cursor.executescript('''
+            CREATE INDEX IF NOT EXISTS idx_eval_job
+                ON evaluations (job_id, relevance_score DESC);
+            CREATE INDEX IF NOT EXISTS idx_eval_time
+                ON evaluations (evaluated_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_eval_resume
+                ON evaluations (resume_id);
+            CREATE INDEX IF NOT EXISTS idx_jobs_created
+                ON jobs (created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_resumes_uploaded
+                ON resumes (uploaded_at DESC);
+        ''')
+
+        # Normalized skill vocabulary: the comma-joined skills TEXT columns
+        # stay for display, but matching goes through these join tables so
+        # it is indexed and alias-aware instead of string reconciliation
+        cursor.executescript('''
+            CREATE TABLE IF NOT EXISTS skills (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE COLLATE NOCASE NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS skill_aliases (
+                alias TEXT PRIMARY KEY,
+                skill_id INTEGER REFERENCES skills (id)
+            );
+            CREATE TABLE IF NOT EXISTS resume_skills (
+                resume_id INTEGER REFERENCES resumes (id) ON DELETE CASCADE,
+                skill_id INTEGER REFERENCES skills (id),
+                PRIMARY KEY (resume_id, skill_id)
+            );
+            CREATE TABLE IF NOT EXISTS job_skills (
+                job_id INTEGER REFERENCES jobs (id) ON DELETE CASCADE,
+                skill_id INTEGER REFERENCES skills (id),
+                PRIMARY KEY (job_id, skill_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_resume_skills_skill
+                ON resume_skills (skill_id);
+            CREATE INDEX IF NOT EXISTS idx_job_skills_skill
+                ON job_skills (skill_id);
+        ''')
+
+        # Per-resume skill bitmask (bit i = skills.id i), so a pairwise
+        # skills intersection is one AND instead of set construction
+        try:
+            cursor.execute('ALTER TABLE resumes ADD COLUMN skills_mask INTEGER NOT NULL DEFAULT 0')
+            self._masks_need_backfill = True
+        except sqlite3.OperationalError:
+            self._masks_need_backfill = False
+        # popcount in SQL, e.g. ORDER BY popcount(skills_mask & :job_mask)
+        self.conn.create_function('popcount', 1, int.bit_count, deterministic=True)
+
+        # Full-text index over resume skills/summary, kept in sync by
+        # triggers so search never rescans the base table. FTS5 is compiled
+        # into most builds but not all, so it degrades to no search box.
+        try:
+            cursor.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS resumes_fts USING fts5(
+                    skills, summary,
+                    content='resumes', content_rowid='id',
+                    tokenize='porter unicode61'
+                );
+                CREATE TRIGGER IF NOT EXISTS resumes_fts_ai AFTER INSERT ON resumes BEGIN
+                    INSERT INTO resumes_fts (rowid, skills, summary)
+                    VALUES (new.id, new.skills, new.summary);
+                END;
+                CREATE TRIGGER IF NOT EXISTS resumes_fts_ad AFTER DELETE ON resumes BEGIN
+                    INSERT INTO resumes_fts (resumes_fts, rowid, skills, summary)
+                    VALUES ('delete', old.id, old.skills, old.summary);
+                END;
+                CREATE TRIGGER IF NOT EXISTS resumes_fts_au AFTER UPDATE ON resumes BEGIN
+                    INSERT INTO resumes_fts (resumes_fts, rowid, skills, summary)
+                    VALUES ('delete', old.id, old.skills, old.summary);
+                    INSERT INTO resumes_fts (rowid, skills, summary)
+                    VALUES (new.id, new.skills, new.summary);
+                END;
+            ''')
+            # Index rows inserted before the triggers existed
+            cursor.execute('SELECT COUNT(*) FROM resumes_fts')
+            if cursor.fetchone()[0] == 0:
+                cursor.execute("INSERT INTO resumes_fts(resumes_fts) VALUES ('rebuild')")
+            self.fts_enabled = True
+        except sqlite3.OperationalError:
+            self.fts_enabled = False
+
         self.conn.commit()
         self.load_sample_data()
+        self._seed_skill_tables()
+
+    def _seed_skill_tables(self):
+        """Register aliases and index rows that predate the skill tables"""
+        cursor = self.conn.cursor()
+        # Warm the id/name caches so masks read from the database can be
+        # decoded without touching rows lazily
+        cursor.execute('SELECT id, name FROM skills')
+        for skill_id, name in cursor.fetchall():
+            self._skill_ids[name] = skill_id
+            self._skill_names[skill_id] = name
+        for alias, name in self.SKILL_ALIASES.items():
+            cursor.execute('INSERT OR IGNORE INTO skill_aliases (alias, skill_id) VALUES (?, ?)',
+                           (alias, self._skill_id(cursor, name)))
+
+        cursor.execute('SELECT COUNT(*) FROM resume_skills')
+        if cursor.fetchone()[0] == 0:
+            cursor.execute('SELECT id, skills FROM resumes')
+            for row in cursor.fetchall():
+                self.index_resume_skills(cursor, row['id'], row['skills'])
+        cursor.execute('SELECT COUNT(*) FROM job_skills')
+        if cursor.fetchone()[0] == 0:
+            cursor.execute('SELECT id, skills_required FROM jobs')
+            for row in cursor.fetchall():
+                self.index_job_skills(cursor, row['id'], row['skills_required'])
+        if self._masks_need_backfill:
+            cursor.execute('SELECT id, skills FROM resumes')
+            for row in cursor.fetchall():
+                cursor.execute('UPDATE resumes SET skills_mask = ? WHERE id = ?',
+                               (self.skill_mask(cursor, row['skills']), row['id']))
+        self.conn.commit()
+
+    def canonical_skill(self, token):
+        """Lowercase, trim and resolve aliases to the canonical name"""
+        name = token.strip().lower()
+        return self.SKILL_ALIASES.get(name, name)
+
+    def _skill_id(self, cursor, name):
+        """Fetch (or create) the skills.id for a canonical name"""
+        skill_id = self._skill_ids.get(name)
+        if skill_id is None:
+            cursor.execute('INSERT OR IGNORE INTO skills (name) VALUES (?)', (name,))
+            cursor.execute('SELECT id FROM skills WHERE name = ?', (name,))
+            skill_id = self._skill_ids[name] = cursor.fetchone()[0]
+            self._skill_names[skill_id] = name
+        return skill_id
+
+    def skill_mask(self, cursor, skills_text):
+        """Bitmask over skills.id for the skills in a comma-joined list
+
+        SQLite integers are signed 64-bit, so ids past 62 are left out of
+        the mask; the join tables stay the exact representation and the
+        mask is the fast path for intersection counting.
+        """
+        mask = 0
+        for token in (skills_text or '').split(','):
+            if token.strip():
+                skill_id = self._skill_id(cursor, self.canonical_skill(token))
+                if skill_id < 63:
+                    mask |= 1 << skill_id
+        return mask
+
+    def _mask_names(self, mask):
+        """The canonical skill names whose bits are set in mask"""
+        names = []
+        while mask:
+            low_bit = mask & -mask
+            names.append(self._skill_names[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return names
+
+    def _index_skills(self, cursor, table, key_column, row_id, skills_text):
+        skill_ids = {
+            self._skill_id(cursor, self.canonical_skill(token))
+            for token in (skills_text or '').split(',') if token.strip()
+        }
+        cursor.execute(f'DELETE FROM {table} WHERE {key_column} = ?', (row_id,))
+        cursor.executemany(
+            f'INSERT OR IGNORE INTO {table} ({key_column}, skill_id) VALUES (?, ?)',
+            [(row_id, skill_id) for skill_id in skill_ids]
+        )
+
+    def index_resume_skills(self, cursor, resume_id, skills_text):
+        """(Re)build a resume's skill rows and bitmask from its skills text"""
+        self._index_skills(cursor, 'resume_skills', 'resume_id', resume_id, skills_text)
+        cursor.execute('UPDATE resumes SET skills_mask = ? WHERE id = ?',
+                       (self.skill_mask(cursor, skills_text), resume_id))
+
+    def index_job_skills(self, cursor, job_id, skills_text):
+        """(Re)build a job's rows in job_skills from its skills text"""
+        self._index_skills(cursor, 'job_skills', 'job_id', job_id, skills_text)
+
+    def job_skill_names(self, job_id):
+        """Canonical skill names a job requires, in indexing order"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT s.name FROM job_skills js
+            JOIN skills s ON s.id = js.skill_id
+            WHERE js.job_id = ?
+            ORDER BY s.id
+        ''', (job_id,))
+        return [row[0] for row in cursor.fetchall()]
+
+    def matched_skills_by_resume(self, job_id):
+        """Map resume_id -> set of job skills it lists, via one indexed join"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT rs.resume_id, s.name
+            FROM resume_skills rs
+            JOIN job_skills js ON js.skill_id = rs.skill_id
+            JOIN skills s ON s.id = rs.skill_id
+            WHERE js.job_id = ?
+        ''', (job_id,))
+        matched = {}
+        for resume_id, name in cursor.fetchall():
+            matched.setdefault(resume_id, set()).add(name)
+        return matched
+
+    def search_resumes(self, query, limit=20):
+        """Rank resumes against a free-text query with FTS5 bm25
+
+        The query is split into quoted OR-ed terms so user input cannot
+        break the MATCH syntax. Returns (id, name, skills, experience,
+        score) rows, best match first (bm25 is smaller-is-better).
+        """
+        terms = ' OR '.join(
+            '"{}"'.format(t.replace('"', '')) for t in query.split()
+        )
+        if not terms:
+            return []
+        cursor = self.reader.cursor()
+        cursor.execute('''
+            SELECT r.id, r.candidate_name, r.skills, r.experience_years,
+                   bm25(resumes_fts) AS score
+            FROM resumes_fts
+            JOIN resumes r ON r.id = resumes_fts.rowid
+            WHERE resumes_fts MATCH ?
+            ORDER BY score
+            LIMIT ?
+        ''', (terms, limit))
+        return cursor.fetchall()
     
     def load_sample_data(self):
         """Load sample data if tables are empty"""
@@ -134,104 +551,137 @@ class ResumeProcessor:
     
     def extract_resume_info(self, text, filename):
         """Extract basic information from resume text"""
-        # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        email_match = re.search(email_pattern, text)
-        email = email_match.group() if email_match else ''
-        
-        # Extract phone
-        phone_pattern = r'[\+]?[1-9]?[\d\s\-\(\)]{8,15}'
-        phone_match = re.search(phone_pattern, text)
-        phone = phone_match.group().strip() if phone_match else ''
-        
-        # Extract name (first line or near email)
-        lines = text.split('\n')
-        candidate_name = ''
-        for line in lines[:5]:  # Check first 5 lines
-            line = line.strip()
-            if line and len(line.split()) <= 4 and not '@' in line and not any(char.isdigit() for char in line):
-                candidate_name = line
-                break
-        
-        if not candidate_name:
-            candidate_name = os.path.splitext(filename)[0].replace('_', ' ').replace('-', ' ').title()
-        
-        # Extract skills
-        skills_found = []
-        text_lower = text.lower()
-        for skill in self.skills_db:
-            if skill.lower() in text_lower:
-                skills_found.append(skill)
-        
-        # Extract experience years
-        exp_pattern = r'(\d+)[\+]?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)'
-        exp_match = re.search(exp_pattern, text.lower())
-        experience_years = int(exp_match.group(1)) if exp_match else 0
-        
-        # Create summary
-        summary = ' '.join(text.split()[:50])  # First 50 words
-        
-        return {
-            'candidate_name': candidate_name or 'Unknown Candidate',
-            'email': email,
-            'phone': phone,
-            'skills': ', '.join(skills_found[:10]),  # Limit to 10 skills
-            'experience_years': experience_years,
-            'summary': summary
-        }
+        return extract_resume_info(text, filename)
     
+    def make_job_scorer(self, job_data):
+        """Specialize the scoring rules for one job
+
+        The job's skill mask, its popcount and the experience bounds are
+        captured as closure constants, so nothing about the job is
+        re-parsed per candidate - the returned score(resume_mask, exp)
+        is mask arithmetic plus a couple of comparisons.
+        """
+        cursor = self.conn.cursor()
+        job_mask = self.skill_mask(cursor, job_data.get('skills_required', ''))
+        job_count = job_mask.bit_count()
+        exp_min = job_data.get('experience_min', 0)
+        exp_max = job_data.get('experience_max', 10)
+        mask_names = self._mask_names
+
+        def score(resume_mask, candidate_exp):
+            matched_mask = job_mask & resume_mask
+            skills_score = (matched_mask.bit_count() / job_count) * 100 if job_count else 0
+
+            if exp_min <= candidate_exp <= exp_max:
+                experience_score = 100
+            elif candidate_exp < exp_min:
+                experience_score = max(0, (candidate_exp / exp_min) * 80)
+            else:
+                experience_score = max(60, 100 - ((candidate_exp - exp_max) * 5))
+
+            relevance_score = (skills_score * 0.6 + experience_score * 0.4)
+
+            if relevance_score >= 75:
+                overall_fit = "High"
+            elif relevance_score >= 50:
+                overall_fit = "Medium"
+            else:
+                overall_fit = "Low"
+
+            matched_skills = mask_names(matched_mask)
+            missing_skills = mask_names(job_mask & ~resume_mask)
+
+            recommendations = []
+            if missing_skills:
+                recommendations.append(f"Consider learning: {', '.join(missing_skills[:3])}")
+            if candidate_exp < exp_min:
+                recommendations.append(f"Gain {exp_min - candidate_exp} more years of experience")
+            if skills_score < 50:
+                recommendations.append("Focus on developing technical skills mentioned in job requirements")
+
+            return {
+                'relevance_score': round(relevance_score, 1),
+                'skills_match_score': round(skills_score, 1),
+                'experience_match_score': round(experience_score, 1),
+                'overall_fit': overall_fit,
+                'matched_skills': ', '.join(matched_skills),
+                'missing_skills': ', '.join(missing_skills),
+                'recommendations': '; '.join(recommendations) if recommendations else 'Great fit for the role!'
+            }
+
+        return score
+
     def evaluate_resume(self, resume_data, job_data):
         """Evaluate resume against job requirements"""
-        # Extract skills from job
-        job_skills = [skill.strip().lower() for skill in job_data.get('skills_required', '').split(',')]
-        resume_skills = [skill.strip().lower() for skill in resume_data.get('skills', '').split(',')]
-        
-        # Calculate skills match
-        matched_skills = list(set(job_skills) & set(resume_skills))
-        missing_skills = list(set(job_skills) - set(resume_skills))
-        skills_score = (len(matched_skills) / len(job_skills)) * 100 if job_skills else 0
-        
-        # Calculate experience match
+        cursor = self.conn.cursor()
+        scorer = self.make_job_scorer(job_data)
+        return scorer(self.skill_mask(cursor, resume_data.get('skills', '')),
+                      resume_data.get('experience_years', 0))
+
+    def batch_evaluate(self, resumes, job_data):
+        """Score all resumes against one job with vectorized NumPy math
+
+        Same scoring rules as evaluate_resume, but the per-candidate set
+        intersections and piecewise experience branches collapse into a
+        boolean presence matrix and a couple of np.where passes; only the
+        per-row recommendation strings stay in Python. Resumes are rows
+        with id and experience_years columns; returns one evaluation
+        dict per row, in order.
+        """
+        # Matched pairs come from one indexed join over the normalized
+        # skill tables, which also resolves aliases ('nodejs' vs 'node.js')
+        # that comma-string comparison missed
+        job_skills = self.job_skill_names(job_data['id'])
+        matched_map = self.matched_skills_by_resume(job_data['id'])
+        n, m = len(resumes), len(job_skills)
+
+        # presence[i, j]: resume i lists job skill j
+        presence = np.fromiter(
+            (skill in matched_map.get(resume['id'], ())
+             for resume in resumes for skill in job_skills),
+            dtype=bool, count=n * m
+        ).reshape(n, m)
+        skills_scores = presence.sum(axis=1) / m * 100.0 if m else np.zeros(n)
+
+        exp = np.array([resume['experience_years'] or 0 for resume in resumes], dtype=np.float64)
         exp_min = job_data.get('experience_min', 0)
         exp_max = job_data.get('experience_max', 10)
-        candidate_exp = resume_data.get('experience_years', 0)
-        
-        if exp_min <= candidate_exp <= exp_max:
-            experience_score = 100
-        elif candidate_exp < exp_min:
-            experience_score = max(0, (candidate_exp / exp_min) * 80)
-        else:
-            experience_score = max(60, 100 - ((candidate_exp - exp_max) * 5))
-        
-        # Overall relevance score
-        relevance_score = (skills_score * 0.6 + experience_score * 0.4)
-        
-        # Determine fit level
-        if relevance_score >= 75:
-            overall_fit = "High"
-        elif relevance_score >= 50:
-            overall_fit = "Medium"
-        else:
-            overall_fit = "Low"
-        
-        # Generate recommendations
-        recommendations = []
-        if len(missing_skills) > 0:
-            recommendations.append(f"Consider learning: {', '.join(missing_skills[:3])}")
-        if candidate_exp < exp_min:
-            recommendations.append(f"Gain {exp_min - candidate_exp} more years of experience")
-        if skills_score < 50:
-            recommendations.append("Focus on developing technical skills mentioned in job requirements")
-        
-        return {
-            'relevance_score': round(relevance_score, 1),
-            'skills_match_score': round(skills_score, 1),
-            'experience_match_score': round(experience_score, 1),
-            'overall_fit': overall_fit,
-            'matched_skills': ', '.join(matched_skills),
-            'missing_skills': ', '.join(missing_skills),
-            'recommendations': '; '.join(recommendations) if recommendations else 'Great fit for the role!'
-        }
+        # max(exp_min, 1): the below-minimum branch is never selected when
+        # exp_min is 0, but np.where still evaluates it
+        exp_scores = np.where(
+            (exp >= exp_min) & (exp <= exp_max), 100.0,
+            np.where(exp < exp_min,
+                     np.maximum(0.0, exp / max(exp_min, 1) * 80.0),
+                     np.maximum(60.0, 100.0 - (exp - exp_max) * 5.0))
+        )
+
+        relevance_scores = skills_scores * 0.6 + exp_scores * 0.4
+        fits = np.where(relevance_scores >= 75, 'High',
+                        np.where(relevance_scores >= 50, 'Medium', 'Low'))
+
+        evaluations = []
+        for i in range(n):
+            matched = [s for j, s in enumerate(job_skills) if presence[i, j]]
+            missing = [s for j, s in enumerate(job_skills) if not presence[i, j]]
+
+            recommendations = []
+            if missing:
+                recommendations.append(f"Consider learning: {', '.join(missing[:3])}")
+            if exp[i] < exp_min:
+                recommendations.append(f"Gain {exp_min - int(exp[i])} more years of experience")
+            if skills_scores[i] < 50:
+                recommendations.append("Focus on developing technical skills mentioned in job requirements")
+
+            evaluations.append({
+                'relevance_score': round(float(relevance_scores[i]), 1),
+                'skills_match_score': round(float(skills_scores[i]), 1),
+                'experience_match_score': round(float(exp_scores[i]), 1),
+                'overall_fit': str(fits[i]),
+                'matched_skills': ', '.join(matched),
+                'missing_skills': ', '.join(missing),
+                'recommendations': '; '.join(recommendations) if recommendations else 'Great fit for the role!'
+            })
+        return evaluations
 
 # Initialize processor
 @st.cache_resource
@@ -261,23 +711,49 @@ def main():
     elif page == "Evaluate":
         show_evaluate()
 
-def show_dashboard():
-    st.header("📊 Dashboard")
-    
-    cursor = processor.conn.cursor()
-    
-    # Get statistics
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_dashboard_stats(epoch):
+    """Run the dashboard queries, cached until the data changes
+
+    `epoch` is (evaluation count, latest evaluated_at): it is only a cache
+    key, cheap to compute, and changes whenever new evaluations land. The
+    ttl bounds staleness from uploads, which do not move the epoch.
+    """
+    cursor = processor.reader.cursor()
+
     cursor.execute('SELECT COUNT(*) FROM jobs')
     total_jobs = cursor.fetchone()[0]
-    
+
     cursor.execute('SELECT COUNT(*) FROM resumes')
     total_resumes = cursor.fetchone()[0]
-    
+
     cursor.execute('SELECT COUNT(*), AVG(relevance_score) FROM evaluations')
     eval_stats = cursor.fetchone()
     total_evaluations = eval_stats[0] or 0
     avg_score = round(eval_stats[1] or 0, 1)
-    
+
+    # Straight into columnar buffers - no intermediate list of row tuples,
+    # and a DataFrame pickles cleanly for st.cache_data
+    recent_df = pd.read_sql_query('''
+        SELECT candidate_name AS Candidate, relevance_score AS Score,
+               overall_fit AS Fit, evaluated_at AS Date
+        FROM evaluations
+        ORDER BY evaluated_at DESC
+        LIMIT 10
+    ''', processor.reader)
+
+    return total_jobs, total_resumes, total_evaluations, avg_score, recent_df
+
+def show_dashboard():
+    st.header("📊 Dashboard")
+
+    cursor = processor.reader.cursor()
+    cursor.execute('SELECT COUNT(*), MAX(evaluated_at) FROM evaluations')
+    epoch = tuple(cursor.fetchone())
+
+    total_jobs, total_resumes, total_evaluations, avg_score, recent_df = \
+        _fetch_dashboard_stats(epoch)
+
     # Display metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -296,130 +772,237 @@ def show_dashboard():
     # Recent evaluations
     if total_evaluations > 0:
         st.subheader("Recent Evaluations")
-        cursor.execute('''
-            SELECT candidate_name, relevance_score, overall_fit, evaluated_at 
-            FROM evaluations 
-            ORDER BY evaluated_at DESC 
-            LIMIT 10
-        ''')
-        
-        recent_data = cursor.fetchall()
-        df = pd.DataFrame(recent_data, columns=['Candidate', 'Score', 'Fit', 'Date'])
-        st.dataframe(df, use_container_width=True)
+        st.dataframe(recent_df, use_container_width=True)
+
+# Rows per page on the listing pages; the LIMIT/OFFSET queries ride the
+# created_at/uploaded_at indexes, so per-page cost stays flat as the
+# tables grow
+PAGE_SIZE = 25
+
+def _page_number(label, total):
+    """Shared page picker; returns the 1-based page for `total` rows"""
+    pages = max(1, -(-total // PAGE_SIZE))
+    if pages == 1:
+        return 1
+    return st.number_input(label, min_value=1, max_value=pages, value=1)
 
 def show_jobs():
     st.header("💼 Job Postings")
-    
-    cursor = processor.conn.cursor()
-    cursor.execute('SELECT * FROM jobs ORDER BY created_at DESC')
+
+    cursor = processor.reader.cursor()
+    cursor.execute('SELECT COUNT(*) FROM jobs')
+    page = _page_number('Page', cursor.fetchone()[0])
+    cursor.execute('''
+        SELECT title, company, location, description, requirements,
+               skills_required, experience_min, experience_max
+        FROM jobs ORDER BY created_at DESC
+        LIMIT ? OFFSET ?
+    ''', (PAGE_SIZE, (page - 1) * PAGE_SIZE))
     jobs = cursor.fetchall()
-    
+
     if jobs:
         for job in jobs:
-            with st.expander(f"{job[1]} - {job[3]}"):
-                st.write(f"**Company:** {job[2]}")
-                st.write(f"**Description:** {job[4]}")
-                st.write(f"**Requirements:** {job[5]}")
-                st.write(f"**Experience:** {job[7]}-{job[8]} years")
-                st.write(f"**Skills:** {job[6]}")
+            with st.expander(f"{job['title']} - {job['location']}"):
+                st.write(f"**Company:** {job['company']}")
+                st.write(f"**Description:** {job['description']}")
+                st.write(f"**Requirements:** {job['requirements']}")
+                st.write(f"**Experience:** {job['experience_min']}-{job['experience_max']} years")
+                st.write(f"**Skills:** {job['skills_required']}")
     else:
         st.info("No job postings available.")
 
 def show_resumes():
     st.header("👥 Candidate Resumes")
-    
-    cursor = processor.conn.cursor()
-    cursor.execute('SELECT * FROM resumes ORDER BY uploaded_at DESC')
-    resumes = cursor.fetchall()
-    
-    if resumes:
-        # Convert to DataFrame for better display
-        df = pd.DataFrame(resumes, columns=[
-            'ID', 'Name', 'Email', 'Phone', 'Skills', 'Experience', 'Summary', 'Uploaded'
-        ])
-        
+
+    # Free-text search ranked inside SQLite (bm25) when FTS5 is available
+    if processor.fts_enabled:
+        query = st.text_input("🔍 Search resumes",
+                              placeholder="e.g. python aws docker")
+        if query:
+            hits = processor.search_resumes(query)
+            if hits:
+                st.dataframe(pd.DataFrame(
+                    [(h[1], h[2], h[3]) for h in hits],
+                    columns=['Name', 'Skills', 'Experience']
+                ), use_container_width=True)
+            else:
+                st.info("No resumes match that search.")
+
+    cursor = processor.reader.cursor()
+    cursor.execute('SELECT COUNT(*) FROM resumes')
+    page = _page_number('Page', cursor.fetchone()[0])
+    # Project only what the table shows, read directly into DataFrame
+    # columns rather than via a list of row tuples
+    df = pd.read_sql_query('''
+        SELECT candidate_name AS Name, email AS Email,
+               skills AS Skills, experience_years AS Experience,
+               uploaded_at AS Uploaded
+        FROM resumes ORDER BY uploaded_at DESC
+        LIMIT ? OFFSET ?
+    ''', processor.reader, params=(PAGE_SIZE, (page - 1) * PAGE_SIZE))
+
+    if not df.empty:
         # Display as interactive table
-        st.dataframe(df[['Name', 'Email', 'Skills', 'Experience', 'Uploaded']], use_container_width=True)
-        
-        # Resume details
+        st.dataframe(df, use_container_width=True)
+
+        # Resume details (selectbox capped to the most recent 100; the
+        # full row is fetched only for the selection)
         st.subheader("Resume Details")
-        selected_resume = st.selectbox("Select a resume to view details:", 
-                                     options=[(r[0], r[1]) for r in resumes],
+        cursor.execute('''
+            SELECT id, candidate_name FROM resumes
+            ORDER BY uploaded_at DESC LIMIT 100
+        ''')
+        selected_resume = st.selectbox("Select a resume to view details:",
+                                     options=[(r['id'], r['candidate_name']) for r in cursor.fetchall()],
                                      format_func=lambda x: x[1])
-        
+
         if selected_resume:
             resume_id = selected_resume[0]
-            cursor.execute('SELECT * FROM resumes WHERE id = ?', (resume_id,))
+            cursor.execute('''
+                SELECT candidate_name, email, phone, skills, experience_years,
+                       summary, uploaded_at
+                FROM resumes WHERE id = ?
+            ''', (resume_id,))
             resume = cursor.fetchone()
-            
+
             if resume:
                 col1, col2 = st.columns(2)
-                
+
                 with col1:
-                    st.write(f"**Name:** {resume[1]}")
-                    st.write(f"**Email:** {resume[2] or 'Not provided'}")
-                    st.write(f"**Phone:** {resume[3] or 'Not provided'}")
-                    st.write(f"**Experience:** {resume[5]} years")
-                
+                    st.write(f"**Name:** {resume['candidate_name']}")
+                    st.write(f"**Email:** {resume['email'] or 'Not provided'}")
+                    st.write(f"**Phone:** {resume['phone'] or 'Not provided'}")
+                    st.write(f"**Experience:** {resume['experience_years']} years")
+
                 with col2:
-                    st.write(f"**Skills:** {resume[4]}")
-                    st.write(f"**Uploaded:** {resume[7]}")
-                
-                st.write(f"**Summary:** {resume[6]}")
-                
-                # Delete button
-                if st.button(f"🗑️ Delete {resume[1]}'s Resume", type="secondary"):
-                    cursor.execute('DELETE FROM evaluations WHERE resume_id = ?', (resume_id,))
-                    cursor.execute('DELETE FROM resumes WHERE id = ?', (resume_id,))
+                    st.write(f"**Skills:** {resume['skills']}")
+                    st.write(f"**Uploaded:** {resume['uploaded_at']}")
+
+                st.write(f"**Summary:** {resume['summary']}")
+
+                # Delete button (writes go through the writer connection;
+                # `cursor` here belongs to this thread's read-only one)
+                if st.button(f"🗑️ Delete {resume['candidate_name']}'s Resume", type="secondary"):
+                    writer = processor.conn.cursor()
+                    writer.execute('DELETE FROM evaluations WHERE resume_id = ?', (resume_id,))
+                    writer.execute('DELETE FROM resume_skills WHERE resume_id = ?', (resume_id,))
+                    writer.execute('DELETE FROM resumes WHERE id = ?', (resume_id,))
                     processor.conn.commit()
-                    st.success(f"Resume for {resume[1]} deleted successfully!")
+                    st.success(f"Resume for {resume['candidate_name']} deleted successfully!")
                     st.rerun()
     else:
         st.info("No resumes uploaded yet.")
 
+@st.cache_data(show_spinner=False)
+def _extract_resume_cached(content_hash, filename, _text):
+    """Memoized extract_resume_info keyed on the upload's SHA-256
+
+    The leading-underscore text argument is excluded from the cache key,
+    so the key is just (hash, filename) - cheap to compute and stable for
+    identical re-uploads.
+    """
+    return extract_resume_info(_text, filename)
+
+def _read_upload(uploaded_file):
+    """Stream one upload to a temp file and parse its text
+
+    The copy runs in 1 MiB chunks with the SHA-256 folded into the same
+    pass - getvalue() would hold the whole file in memory alongside the
+    disk copy. Returns (text, content_hash).
+    """
+    hasher = hashlib.sha256()
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
+        for chunk in iter(lambda: uploaded_file.read(1 << 20), b''):
+            hasher.update(chunk)
+            tmp_file.write(chunk)
+        tmp_path = tmp_file.name
+
+    try:
+        # Read file content with the parser that matches the format -
+        # decoding PDF/DOCX bytes as UTF-8 yielded binary junk that the
+        # extraction regexes then scanned for nothing
+        suffix = uploaded_file.name.rsplit('.', 1)[-1].lower()
+        if suffix == 'pdf' and pdfplumber is not None:
+            with pdfplumber.open(tmp_path) as pdf:
+                text = '\n'.join(page.extract_text() or '' for page in pdf.pages)
+        elif suffix == 'docx' and docx is not None:
+            text = '\n'.join(p.text for p in docx.Document(tmp_path).paragraphs)
+        elif suffix == 'txt':
+            with open(tmp_path, 'r', encoding='utf-8', errors='ignore') as f:
+                text = f.read()
+        else:
+            # No parser available: best-effort decode
+            with open(tmp_path, 'rb') as f:
+                text = f.read().decode('utf-8', errors='ignore')
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+    return text, hasher.hexdigest()
+
 def show_upload():
     st.header("📄 Upload Resume")
-    
-    uploaded_file = st.file_uploader("Choose a resume file", 
+
+    uploaded_files = st.file_uploader("Choose resume files",
                                    type=['txt', 'pdf', 'doc', 'docx'],
+                                   accept_multiple_files=True,
                                    help="Upload PDF, DOC, DOCX, or TXT files")
-    
-    if uploaded_file is not None:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_path = tmp_file.name
-        
+
+    if not uploaded_files:
+        return
+
+    parsed = []  # (filename, text, content_hash)
+    for uploaded_file in uploaded_files:
         try:
-            # Read file content
-            if uploaded_file.type == "text/plain":
-                text = uploaded_file.getvalue().decode("utf-8")
-            else:
-                # For other formats, read as text (simplified)
-                with open(tmp_path, 'rb') as f:
-                    text = f.read().decode('utf-8', errors='ignore')
-            
-            # Extract resume information
-            resume_data = processor.extract_resume_info(text, uploaded_file.name)
-            
-            # Display extracted information
-            st.subheader("Extracted Information")
+            text, content_hash = _read_upload(uploaded_file)
+            parsed.append((uploaded_file.name, text, content_hash))
+        except Exception as e:
+            st.error(f"Error processing {uploaded_file.name}: {str(e)}")
+
+    if not parsed:
+        return
+
+    if len(parsed) > 1:
+        # Extraction is CPU-bound and independent per file; fan a batch
+        # out to worker processes (extract_resume_info is module-level,
+        # so each worker has the compiled matchers after import)
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(len(parsed), os.cpu_count() or 1)) as pool:
+            extracted = list(pool.map(
+                _extract_resume_args,
+                [(text, filename) for filename, text, _ in parsed]
+            ))
+    else:
+        filename, text, content_hash = parsed[0]
+        extracted = [_extract_resume_cached(content_hash, filename, text)]
+
+    # Per-file preview
+    st.subheader("Extracted Information")
+    for (filename, _, _), resume_data in zip(parsed, extracted):
+        with st.expander(f"📄 {resume_data['candidate_name']} ({filename})",
+                         expanded=len(parsed) == 1):
             col1, col2 = st.columns(2)
-            
+
             with col1:
                 st.write(f"**Name:** {resume_data['candidate_name']}")
                 st.write(f"**Email:** {resume_data['email'] or 'Not found'}")
                 st.write(f"**Phone:** {resume_data['phone'] or 'Not found'}")
-            
+
             with col2:
                 st.write(f"**Experience:** {resume_data['experience_years']} years")
                 st.write(f"**Skills:** {resume_data['skills'] or 'None detected'}")
-            
+
             st.write(f"**Summary:** {resume_data['summary']}")
-            
-            # Save to database
-            if st.button("💾 Save Resume", type="primary"):
-                cursor = processor.conn.cursor()
+
+    # Save the whole batch in one transaction; the per-row execute is
+    # kept (rather than executemany) because each insert's lastrowid
+    # feeds the skill indexing
+    if st.button("💾 Save All", type="primary"):
+        uploaded_at = datetime.now().isoformat()
+        cursor = processor.conn.cursor()
+        with processor.conn:
+            for resume_data in extracted:
                 cursor.execute('''
                     INSERT INTO resumes (candidate_name, email, phone, skills, experience_years, summary, uploaded_at)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -430,19 +1013,12 @@ def show_upload():
                     resume_data['skills'],
                     resume_data['experience_years'],
                     resume_data['summary'],
-                    datetime.now().isoformat()
+                    uploaded_at
                 ))
-                processor.conn.commit()
-                
-                st.success(f"✅ Resume for {resume_data['candidate_name']} saved successfully!")
-                
-        except Exception as e:
-            st.error(f"Error processing file: {str(e)}")
-        
-        finally:
-            # Clean up temp file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+                processor.index_resume_skills(cursor, cursor.lastrowid,
+                                              resume_data['skills'])
+
+        st.success(f"✅ Saved {len(extracted)} resume(s) successfully!")
 
 def show_evaluate():
     st.header("🎯 Batch Evaluation")
@@ -466,80 +1042,78 @@ def show_evaluate():
         job_id = selected_job[0]
         
         # Get job details
-        cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
+        cursor.execute('''
+            SELECT id, title, skills_required, experience_min, experience_max
+            FROM jobs WHERE id = ?
+        ''', (job_id,))
         job_data = cursor.fetchone()
-        
+
         if job_data:
-            job_info = {
-                'id': job_data[0],
-                'title': job_data[1],
-                'skills_required': job_data[6],
-                'experience_min': job_data[7],
-                'experience_max': job_data[8]
-            }
-            
-            # Get all resumes
-            cursor.execute('SELECT * FROM resumes')
+            job_info = dict(job_data)
+
+            # Get all resumes (only the columns scoring needs)
+            cursor.execute('SELECT id, candidate_name, experience_years FROM resumes')
             resumes = cursor.fetchall()
             
             if resumes:
                 st.subheader("Evaluation Results")
-                
-                # Clear previous evaluations for this job
-                cursor.execute('DELETE FROM evaluations WHERE job_id = ?', (job_id,))
-                
-                results = []
-                progress_bar = st.progress(0)
-                
-                for i, resume in enumerate(resumes):
-                    resume_data = {
-                        'id': resume[0],
-                        'candidate_name': resume[1],
-                        'skills': resume[4],
-                        'experience_years': resume[5]
-                    }
-                    
-                    # Evaluate resume
-                    evaluation = processor.evaluate_resume(resume_data, job_info)
-                    
-                    # Save evaluation
-                    cursor.execute('''
-                        INSERT INTO evaluations 
-                        (job_id, resume_id, candidate_name, relevance_score, skills_match_score, 
-                         experience_match_score, overall_fit, matched_skills, missing_skills, recommendations)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        job_id, resume_data['id'], resume_data['candidate_name'],
+
+                # Score the whole pool in one vectorized call instead of
+                # one evaluate_resume per row
+                evaluations = processor.batch_evaluate(resumes, job_info)
+
+                rows = [
+                    (
+                        job_id, resume['id'], resume['candidate_name'],
                         evaluation['relevance_score'], evaluation['skills_match_score'],
                         evaluation['experience_match_score'], evaluation['overall_fit'],
                         evaluation['matched_skills'], evaluation['missing_skills'],
                         evaluation['recommendations']
-                    ))
-                    
-                    results.append({
-                        'Candidate': resume_data['candidate_name'],
-                        'Score': f"{evaluation['relevance_score']}%",
-                        'Fit': evaluation['overall_fit'],
-                        'Skills Match': f"{evaluation['skills_match_score']}%",
-                        'Experience Match': f"{evaluation['experience_match_score']}%",
-                        'Recommendations': evaluation['recommendations']
-                    })
-                    
-                    progress_bar.progress((i + 1) / len(resumes))
-                
-                processor.conn.commit()
-                
-                # Display results
-                df = pd.DataFrame(results)
-                df = df.sort_values('Score', ascending=False, key=lambda x: x.str.rstrip('%').astype(float))
-                
-                st.dataframe(df, use_container_width=True)
+                    )
+                    for resume, evaluation in zip(resumes, evaluations)
+                ]
+
+                # Clear the job's previous evaluations and write the new
+                # batch in one transaction - one commit instead of a disk
+                # sync per resume
+                with processor.conn:
+                    cursor.execute('DELETE FROM evaluations WHERE job_id = ?', (job_id,))
+                    cursor.executemany('''
+                        INSERT INTO evaluations
+                        (job_id, resume_id, candidate_name, relevance_score, skills_match_score,
+                         experience_match_score, overall_fit, matched_skills, missing_skills, recommendations)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', rows)
                 
-                # Summary
+                # Display straight from the just-written rows: sorted by
+                # the indexed ORDER BY in SQL, scores kept numeric and
+                # formatted as percentages only at render time (no more
+                # '%'-string parsing in a pandas sort key)
+                df = pd.read_sql_query('''
+                    SELECT candidate_name AS Candidate, relevance_score AS Score,
+                           overall_fit AS Fit, skills_match_score AS "Skills Match",
+                           experience_match_score AS "Experience Match",
+                           recommendations AS Recommendations
+                    FROM evaluations
+                    WHERE job_id = ?
+                    ORDER BY relevance_score DESC
+                ''', processor.conn, params=(job_id,))
+
+                percent = st.column_config.NumberColumn(format="%.1f%%")
+                st.dataframe(df, use_container_width=True,
+                             column_config={'Score': percent,
+                                            'Skills Match': percent,
+                                            'Experience Match': percent})
+
+                # Summary: one grouped count over the just-written rows
                 st.subheader("Summary")
-                high_fit = len([r for r in results if r['Fit'] == 'High'])
-                medium_fit = len([r for r in results if r['Fit'] == 'Medium'])
-                low_fit = len([r for r in results if r['Fit'] == 'Low'])
+                counts = dict(cursor.execute('''
+                    SELECT overall_fit, COUNT(*) FROM evaluations
+                    WHERE job_id = ? GROUP BY overall_fit
+                ''', (job_id,)).fetchall())
+                high_fit = counts.get('High', 0)
+                medium_fit = counts.get('Medium', 0)
+                low_fit = counts.get('Low', 0)
                 
                 col1, col2, col3 = st.columns(3)
                 with col1: